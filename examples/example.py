@@ -1,6 +1,10 @@
 from collections import deque
+import sys
 
 import pygame as pg
+from pygame.locals import (
+    QUIT, KEYDOWN, KEYUP, VIDEORESIZE, RESIZABLE,
+    K_LEFT, K_RIGHT, K_UP, K_DOWN, K_z)
 from scroll_background import Vector2, ScrollBackground
 
 pg.init()
@@ -8,34 +12,45 @@ pg.init()
 
 def fps_counter():
     fps = deque(maxlen=100)
+    total = 0
     counter = 0
+    caption = ''
     while True:
         new_fps = yield
+        if len(fps) == fps.maxlen:
+            total -= fps[0]
         fps.append(new_fps)
+        total += new_fps
         counter = (counter + 1) % 100
         if counter == 0:
-            pg.display.set_caption('FPS: {:.2f}'.format(sum(fps) / len(fps)))
+            new_caption = 'FPS: {:.2f}'.format(total / len(fps))
+            if new_caption != caption:
+                caption = new_caption
+                pg.display.set_caption(caption)
 
 
 def draw_grid(surface):
-    for x in range(0, surface.get_width(), 50):
-        for y in range(0, surface.get_height(), 50):
-            pg.draw.rect(surface, (0, 255, 0), (x, y, 50, 50))
-    for x in range(0, surface.get_width(), 100):
-        for y in range(50, surface.get_height(), 100):
-            pg.draw.rect(surface, (0, 0, 255), (x, y, 50, 50))
-    for x in range(50, surface.get_width(), 100):
-        for y in range(0, surface.get_height(), 100):
-            pg.draw.rect(surface, (0, 0, 255), (x, y, 50, 50))
+    width, height = surface.get_size()
+    tile = pg.Surface((100, 100))
+    tile.fill((0, 255, 0))
+    tile.fill((0, 0, 255), (0, 50, 50, 50))
+    tile.fill((0, 0, 255), (50, 0, 50, 50))
+    # Build one row of tiles and stamp it down the surface.
+    row = pg.Surface((width, 100))
+    row.blits([(tile, (x, 0)) for x in range(0, width, 100)], doreturn=0)
+    surface.blits([(row, (0, y)) for y in range(0, height, 100)],
+                  doreturn=0)
 
 
 class Player:
     def __init__(self, background_size):
         start_pos = (background_size.x//2 - 50, background_size.y//2 - 50)
         self.rect = pg.Rect(start_pos, (100, 100))
-        self.image = pg.Surface(self.rect.size)
-        self.image.fill((255, 0, 0))
+        self.images = {}
+        self.image = self.get_image(self.rect.size)
         self.true_pos = Vector2(self.rect.topleft)
+        # Position before the last update, for drawing between steps.
+        self.prev_pos = Vector2(self.true_pos)
         self.max_scroll = background_size - Vector2(self.rect.size)
         self.speed = 5
 
@@ -43,30 +58,46 @@ class Player:
         self.speed *= factor
         self.max_scroll.scale(factor)
         self.true_pos.scale(factor)
-        self.rect.topleft = tuple(self.true_pos)
+        self.prev_pos.scale(factor)
+        self.rect.topleft = self.true_pos.as_tuple()
         self.rect.width *= factor
         self.rect.height *= factor
-        self.image = pg.Surface(self.rect.size)
-        self.image.fill((255, 0, 0))
+        self.image = self.get_image(self.rect.size)
+
+    def get_image(self, size):
+        # Zooming toggles between a few sizes, so reuse old images.
+        if size not in self.images:
+            self.images[size] = pg.Surface(size)
+            self.images[size].fill((255, 0, 0))
+        return self.images[size]
 
     def update(self, delta_time):
-        if pg.key.get_pressed()[pg.K_LEFT]:
+        self.prev_pos.update(self.true_pos)
+        keys = pg.key.get_pressed()
+        if keys[K_LEFT]:
             self.true_pos.x = max(self.true_pos.x - self.speed*delta_time, 0)
-        elif pg.key.get_pressed()[pg.K_RIGHT]:
+        elif keys[K_RIGHT]:
             self.true_pos.x = min(
                 self.true_pos.x + self.speed*delta_time, self.max_scroll.x)
-        if pg.key.get_pressed()[pg.K_UP]:
+        if keys[K_UP]:
             self.true_pos.y = max(self.true_pos.y - self.speed*delta_time, 0)
-        elif pg.key.get_pressed()[pg.K_DOWN]:
+        elif keys[K_DOWN]:
             self.true_pos.y = min(
                 self.true_pos.y + self.speed*delta_time, self.max_scroll.y)
-        self.rect = pg.Rect(*self.true_pos, *self.rect.size)
+
+    def interpolate(self, alpha):
+        # alpha is how far time has moved past the last update, in steps.
+        draw_pos = self.prev_pos.lerp(self.true_pos, alpha)
+        self.rect.x = int(draw_pos.x)
+        self.rect.y = int(draw_pos.y)
+        return draw_pos
 
 
 class Game():
-    def __init__(self):
-        background = pg.Surface((1200, 1200))
-        display = pg.display.set_mode((900, 900), pg.RESIZABLE)
+    def __init__(self, busy_loop=False):
+        display = pg.display.set_mode((900, 900), RESIZABLE)
+        # Match the display's pixel format so blits don't convert pixels.
+        background = pg.Surface((1200, 1200)).convert()
         draw_grid(background)
         self.background = ScrollBackground(background, display, (0, 0))
 
@@ -76,47 +107,85 @@ class Game():
         self.background.blit(pg.Surface((123, 123)), (300, 300))
         self.background.redraw_display()
 
+        # Keep mouse motion and other unused events out of the queue.
+        pg.event.set_blocked(None)
+        pg.event.set_allowed([QUIT, KEYDOWN, KEYUP, VIDEORESIZE])
+
         self.clock = pg.time.Clock()
+        # tick_busy_loop is more accurate where the OS oversleeps, at the
+        # cost of keeping a CPU core busy.
+        self.tick = self.clock.tick_busy_loop if busy_loop else self.clock.tick
         self.running = True
+        self.redraw_sprites = True
 
     def main(self):
         counter = fps_counter()
         next(counter)
         draw_rects = []
+        player_center = Vector2((0, 0))
+        # Bind frequently used attributes to locals for the frame loop.
+        background = self.background
+        player = self.player
+        tick = self.tick
+        handle_input = self.handle_input
+        get_fps = self.clock.get_fps
+        update_display = pg.display.update
+        # Time not yet simulated, measured in 1/60 s steps.
+        unsimulated_steps = 0
         while self.running:
-            delta_time = self.clock.tick(60)/1000 * 60
-            self.handle_input(delta_time)
-            self.player.update(delta_time)
-            prev_display_pos = self.background.display_pos
-            player_size = Vector2(self.player.rect.size).scale(0.5)
-            self.background.center(Vector2(self.player.true_pos) + player_size)
-            sprite_rects = self.background.draw_sprites((self.player,))
-            if self.background.display_pos != prev_display_pos:
-                draw_rects.append(((0, 0), self.background.display.get_size()))
-            else:
-                draw_rects.extend(sprite_rects)
-            counter.send(self.clock.get_fps())
-            pg.display.update(draw_rects)
+            delta_time = tick(60)/1000 * 60
+            # Don't try to catch up after long stalls, e.g. a window drag.
+            unsimulated_steps = min(unsimulated_steps + delta_time, 5)
+            prev_player_rect = player.rect.copy()
+            handle_input(delta_time)
+            while unsimulated_steps >= 1:
+                player.update(1)
+                unsimulated_steps -= 1
+            # Draw between the last two steps so movement stays smooth
+            # when frames and steps don't line up.
+            draw_pos = player.interpolate(unsimulated_steps)
+            prev_display_pos = background.display_pos
+            player_center.x = draw_pos.x + player.rect.width*0.5
+            player_center.y = draw_pos.y + player.rect.height*0.5
+            background.center(player_center)
+            # A scrolled display changes everywhere, so update all of it
+            # instead of a list of overlapping rects.
+            full_update = background.display_pos != prev_display_pos
+            if full_update:
+                background.draw_sprites((player,))
+            elif self.redraw_sprites or player.rect != prev_player_rect:
+                draw_rects.extend(background.draw_sprites((player,)))
+            self.redraw_sprites = False
+            counter.send(get_fps())
+            if full_update:
+                update_display()
+            elif draw_rects:
+                update_display(draw_rects)
             draw_rects.clear()
 
     def handle_input(self, delta_time):
+        new_size = None
         for event in pg.event.get():
-            if event.type == pg.QUIT:
+            if event.type == QUIT:
                 self.running = False
                 break
-            elif event.type == pg.KEYDOWN:
-                if event.key == pg.K_z:
+            elif event.type == KEYDOWN:
+                if event.key == K_z:
                     self.scale(2)
                     continue
-            elif event.type == pg.KEYUP:
-                if event.key == pg.K_z:
+            elif event.type == KEYUP:
+                if event.key == K_z:
                     self.scale(1 / 2)
                     continue
-            elif event.type == pg.VIDEORESIZE:
-                self.background.display = (
-                    pg.display.set_mode(event.size, pg.RESIZABLE))
-                self.background.move_or_center_display()
-                self.background.redraw_display()
+            elif event.type == VIDEORESIZE:
+                new_size = event.size
+        # Dragging the window edge queues many resizes; only the last
+        # one matters.
+        if new_size is not None:
+            self.background.display = pg.display.set_mode(new_size, RESIZABLE)
+            self.background.move_or_center_display()
+            self.background.redraw_display()
+            self.redraw_sprites = True
 
     def scale(self, factor):
         self.background.zoom *= factor
@@ -125,4 +194,4 @@ class Game():
 
 
 if __name__ == '__main__':
-    Game().main()
+    Game(busy_loop='--busy-loop' in sys.argv).main()
@@ -10,7 +10,7 @@ setup(
     url='https://github.com/aarnot/scroll_background',
     packages=find_packages('src', exclude=['docs', 'tests', 'env']),
     package_dir={'': 'src'},
-    install_requires=['pygame == 1.9.3'],
+    install_requires=['pygame >= 2.1.3, < 3'],
     extras_require={
         'test': ['pytest'],
         'docs': ['sphinx', 'numpydoc']
@@ -3,23 +3,25 @@
 
 import math
 import functools
-import collections.abc
 
 import pygame as pg
 
+__all__ = ['Vector2', 'ScrollBackground', 'MultiSurfaceBackground']
+
 pg.init()
 
 
-class Vector2:
+class Vector2(pg.math.Vector2):
     """A utility class that contains an X, and a Y coordinate.
 
-    Two vectors can be added or substracted together. `Vector2` also
-    implements the __iter__ method, which makes `Vector2` instances
-    easy to convert to another iterable.
+    `Vector2` extends `pygame.math.Vector2`, so vector arithmetic,
+    comparison and iteration are implemented in C. Two vectors can be
+    added or substracted together, and `Vector2` instances are easy to
+    convert to another iterable.
 
     Parameters
     ----------
-    pos : iterable of float
+    pos : sequence of float
         The X and Y coordinates.
 
     Attributes
@@ -44,10 +46,14 @@ class Vector2:
     >>> tuple(Vector2((12, 30)))
     (12.0, 30.0)
 
+    Printing a vector shows the same form as its repr.
+
+    >>> print(Vector2((12, 30)))
+    <Vector2(12.0, 30.0)>
+
     """
 
-    def __init__(self, pos):
-        self.x, self.y = (float(coord) for coord in pos)
+    __slots__ = ()
 
     @property
     def length(self):
@@ -58,7 +64,7 @@ class Vector2:
         length : float
 
         """
-        return math.hypot(self.x, self.y)
+        return pg.math.Vector2.length(self)
 
     def scale(self, scale):
         """Multiply vector by scale.
@@ -72,20 +78,9 @@ class Vector2:
         self : Vector2
 
         """
-        self.x *= scale
-        self.y *= scale
+        self *= scale
         return self
 
-    def copy(self):
-        """Return a copy of the vector.
-
-        Returns
-        -------
-        copy : Vector2
-
-        """
-        return Vector2((self.x, self.y))
-
     def asint(self):
         """Return a tuple with the x and y values as integers.
 
@@ -96,87 +91,15 @@ class Vector2:
         """
         return (int(self.x), int(self.y))
 
-    def __eq__(self, other):
-        """Test if two vectors are equal.
-
-        Parameters
-        ----------
-        other : Vector2
+    def as_tuple(self):
+        """Return a tuple with the x and y values.
 
         Returns
         -------
-        bool
+        tuple of float
 
         """
-        return self.x == other.x and self.y == other.y
-
-    def __add__(self, other):
-        """Return the sum of two vectors.
-
-        Parameters
-        ----------
-        other : Vector2
-
-        Returns
-        -------
-        sum  : Vector2
-
-        """
-        return Vector2((self.x + other.x, self.y + other.y))
-
-    def __radd__(self, other):
-        """Return the sum of two vectors.
-
-        Parameters
-        ----------
-        other : Vector2
-
-        Returns
-        -------
-        sum  : Vector2
-
-        """
-        return Vector2((self.x + other.x, self.y + other.y))
-
-    def __sub__(self, other):
-        """Return the difference of two vectors.
-
-        Parameters
-        ----------
-        other : Vector2
-
-        Returns
-        -------
-        difference : Vector2
-
-        """
-        return Vector2((self.x - other.x, self.y - other.y))
-
-    def __rsub__(self, other):
-        """Return the difference of two vectors.
-
-        Parameters
-        ----------
-        other : Vector2
-
-        Returns
-        -------
-        difference : Vector2
-
-        """
-        return Vector2((other.x - self.x, other.y - self.y))
-
-    def __iter__(self):
-        """Iterate a vector.
-
-        Yields
-        ------
-        x : float
-        y : float
-
-        """
-        yield self.x
-        yield self.y
+        return (self.x, self.y)
 
     def __repr__(self):
         """Return the string representation of a vector.
@@ -186,12 +109,17 @@ class Vector2:
         repr : str
 
         """
-        return '<Vector2({}, {})>'.format(self.x, self.y)
+        return '<Vector2(%r, %r)>' % (self.x, self.y)
+
+    # pygame.math.Vector2 has its own __str__, so keep the old output.
+    __str__ = __repr__
 
     @classmethod
     def sequence2vector2(cls, method):
         """Decorator to convert 2-length sequence arguments to vectors.
 
+        Only tuples and lists are converted.
+
         Parameters
         ----------
         func : method
@@ -205,9 +133,15 @@ class Vector2:
         """
         @functools.wraps(method)
         def wrapper(*args, **kwargs):
+            if len(args) == 2 and not kwargs:
+                # Most decorated methods take a single point.
+                instance, arg = args
+                if type(arg) in (tuple, list) and len(arg) == 2:
+                    arg = Vector2(arg)
+                return method(instance, arg)
             arg_list = []
             for arg in args:
-                if isinstance(arg, collections.abc.Sequence) and len(arg) == 2:
+                if type(arg) in (tuple, list) and len(arg) == 2:
                     arg_list.append(Vector2(arg))
                 else:
                     arg_list.append(arg)
@@ -224,23 +158,38 @@ class ScrollBackground:
     Parameters
     ----------
     background : pygame.Surface
+        The instance takes ownership of the surface instead of copying
+        it, so don't draw on it afterwards. Changes would show up at
+        zoom 1 but not in zoomed backgrounds. Pass a copy if you still
+        need the surface. Surfaces without per-pixel alpha are
+        converted to the display's pixel format first if it differs.
     display : pygame.Surface
     display_pos : Vector2
 
     Attributes
     ----------
     display_pos
+    true_pos
     scrolling_area
     zoom
 
     _original_background : pygame.Surface
-        Copy of the original background surface.
+        The original background surface.
     background : pygame.Surface
-        Copy of the original background used for zooming.
+        The background at the current zoom level. Until the zoom is
+        first changed this is the same surface as
+        `_original_background`.
     display : pygame.Surface
         The display surface.
-    true_pos : Vector2
+    _true_x, _true_y : float
         Accurate display position.
+    _display_rect : pygame.Rect
+        Reused by move_or_center_display to clamp the display position.
+    _area_rect : pygame.Rect
+        Reused by move_or_center_display for the scrolling area.
+    _scaled_background : pygame.Surface or None
+        The most recently zoomed background. Only one is kept, so the
+        memory used for zooming stays at one scaled copy.
     clear_rects : list of pygame.Rect
         Rects used to clear sprites from the background.
     _zoom : float
@@ -248,15 +197,40 @@ class ScrollBackground:
 
     """
 
-    @Vector2.sequence2vector2
     def __init__(self, background, display, display_pos):
-        self._original_background = background.copy()
-        self.background = background.copy()
         self.display = display
+        self._original_background = self._convert_surface(background)
+        # Share the original until zooming creates a scaled copy.
+        self.background = self._original_background
         self.true_pos = display_pos
+        self._display_rect = pg.Rect(0, 0, 0, 0)
+        self._area_rect = pg.Rect(0, 0, 0, 0)
+        self._scaled_background = None
         self.clear_rects = []
         self._zoom = 1.0
 
+    def _convert_surface(self, surface):
+        """Return surface in the pixel format of the display.
+
+        Blitting between matching formats avoids converting every pixel
+        on each redraw. Surfaces that already match and surfaces with
+        per-pixel alpha are returned as they are.
+
+        Parameters
+        ----------
+        surface : pygame.Surface
+
+        Returns
+        -------
+        pygame.Surface
+
+        """
+        if (surface.get_flags() & pg.SRCALPHA
+                or (surface.get_bitsize() == self.display.get_bitsize()
+                    and surface.get_masks() == self.display.get_masks())):
+            return surface
+        return surface.convert(self.display)
+
     def blit(self, source, dest, area=None, special_flags=0):
         """Scale arguments and blit them to the display surface.
 
@@ -266,15 +240,18 @@ class ScrollBackground:
 
         """
         # Scale arguments based on zoom factor.
-        source_size = Vector2(source.get_size()).scale(self.zoom).asint()
-        source = pg.transform.scale(source, tuple(source_size))
-        dest = Vector2(dest).scale(self.zoom).asint()
+        zoom = self.zoom
+        source_width, source_height = source.get_size()
+        source = pg.transform.scale(
+            source, (int(source_width*zoom), int(source_height*zoom)))
+        dest_x, dest_y = dest
+        display_x, display_y = self._display_xy()
         if area is not None:
-            area.topleft = Vector2(area.topleft).scale(self.zoom).asint()
-            area.size = Vector2(area.size).scale(self.zoom).asint()
-            area.topleft = (Vector2(area.topleft) - self.display_pos).asint()
+            area.topleft = (int(area.x*zoom) - display_x,
+                            int(area.y*zoom) - display_y)
+            area.size = (int(area.width*zoom), int(area.height*zoom))
 
-        draw_pos = (Vector2(dest) - self.display_pos).asint()
+        draw_pos = (int(dest_x*zoom) - display_x, int(dest_y*zoom) - display_y)
         draw_rect = self.display.blit(source, draw_pos, area, special_flags)
         return draw_rect
 
@@ -282,15 +259,17 @@ class ScrollBackground:
     def display_pos(self):
         """Return true_pos mapped to integer values.
 
+        A new vector is returned each time, so modifying it doesn't
+        move the display. Assign to `display_pos` instead.
+
         Returns
         -------
         Vector2
 
         """
-        return Vector2(round(num, 0) for num in self.true_pos)
+        return Vector2(self._display_xy())
 
     @display_pos.setter
-    @Vector2.sequence2vector2
     def display_pos(self, value):
         """Set true_pos to value.
 
@@ -305,6 +284,50 @@ class ScrollBackground:
         """
         self.true_pos = value
 
+    @property
+    def true_pos(self):
+        """Return the accurate display position.
+
+        The position is stored as two floats, so modifying the returned
+        vector doesn't move the display. Assign a new position instead,
+        e.g. ``background.true_pos += (5, 0)``.
+
+        Returns
+        -------
+        Vector2
+
+        """
+        return Vector2((self._true_x, self._true_y))
+
+    @true_pos.setter
+    def true_pos(self, value):
+        """Set the accurate display position.
+
+        Parameters
+        ----------
+        value : Vector2
+
+        Returns
+        -------
+        None
+
+        """
+        x, y = value
+        self._true_x = float(x)
+        self._true_y = float(y)
+
+    def _display_xy(self):
+        """Return the display position as a tuple of integers.
+
+        Internal code uses this to avoid creating a new Vector2.
+
+        Returns
+        -------
+        tuple of int
+
+        """
+        return round(self._true_x), round(self._true_y)
+
     @property
     def scrolling_area(self):
         """The area inside which the display can be scrolled.
@@ -318,6 +341,16 @@ class ScrollBackground:
         """
         return pg.Rect((0, 0), self.background.get_size())
 
+    def _scrolling_size(self):
+        """Return the size of the scrolling area without building a rect.
+
+        Returns
+        -------
+        tuple of int
+
+        """
+        return self.background.get_size()
+
     @property
     def zoom(self):
         """Return the zoom factor.
@@ -333,6 +366,10 @@ class ScrollBackground:
     def zoom(self, scale):
         """Create a new zoomed background and scale variables.
 
+        The last zoomed background is reused when its size matches, so
+        changes made to the original background after it was scaled
+        don't show up in it.
+
         Parameters
         ----------
         scale : float
@@ -342,11 +379,24 @@ class ScrollBackground:
         None
 
         """
+        if scale == self._zoom:
+            return
         original_bg_size = self._original_background.get_size()
-        new_width, new_height = (int(size*scale) for size in original_bg_size)
-        self.background = pg.transform.scale(self._original_background,
-                                             (new_width, new_height))
-        self.true_pos.scale(scale)
+        new_size = tuple(int(size*scale) for size in original_bg_size)
+        if new_size == original_bg_size:
+            # Nothing to resample, so share the original again.
+            self.background = self._original_background
+        else:
+            # Zooming usually toggles between two levels, so zooming back
+            # in can reuse the last scaled background.
+            scaled = self._scaled_background
+            if scaled is None or scaled.get_size() != new_size:
+                scaled = pg.transform.scale(
+                    self._original_background, new_size)
+                self._scaled_background = scaled
+            self.background = scaled
+        self._true_x *= scale
+        self._true_y *= scale
         self.move_or_center_display()
         self.redraw_display()
         self._zoom = scale
@@ -367,7 +417,6 @@ class ScrollBackground:
         return point - Vector2((self.display.get_width()/2,
                                 self.display.get_height()/2))
 
-    @Vector2.sequence2vector2
     def center(self, point):
         """Scroll the display so that it is centered on a point.
 
@@ -380,17 +429,24 @@ class ScrollBackground:
         None
 
         """
-        centered_pos = self.centered_pos(point)
-        if (centered_pos - self.true_pos).length >= 1:
-            self.scroll(centered_pos - self.true_pos)
+        point_x, point_y = point
+        width, height = self.display.get_size()
+        change_x = point_x - width/2 - self._true_x
+        change_y = point_y - height/2 - self._true_y
+        # Same as a length of at least 1, without the square root.
+        if change_x*change_x + change_y*change_y >= 1:
+            self.scroll(change_x, change_y)
 
-    @Vector2.sequence2vector2
-    def scroll(self, position_change):
+    def scroll(self, position_change, change_y=None):
         """Scroll the display by position_change.
 
         Parameters
         ----------
-        position_change : Vector2
+        position_change : Vector2 or float
+            The change in position, or only the change in x if
+            `change_y` is given.
+        change_y : float, optional
+            The change in y.
 
         Returns
         -------
@@ -406,14 +462,36 @@ class ScrollBackground:
         >>> tuple(background.display_pos)
         (300.0, 300.0)
 
+        The changes in x and y can also be passed separately.
+
+        >>> background.scroll(-100, 0)
+        >>> tuple(background.display_pos)
+        (200.0, 300.0)
+
         """
-        prev_pos = self.display_pos
-        self.true_pos += position_change
+        if change_y is None:
+            change_x, change_y = position_change
+        else:
+            change_x = position_change
+        prev_x = round(self._true_x)
+        prev_y = round(self._true_y)
+        self._true_x += change_x
+        self._true_y += change_y
         self.move_or_center_display()
-        position_change = self.display_pos - prev_pos
-
-        self.display.scroll(int(-position_change.x), int(-position_change.y))
-        self.redraw_rects(*self._calculate_redraw_areas(position_change))
+        change_x = round(self._true_x) - prev_x
+        change_y = round(self._true_y) - prev_y
+        # Sub-pixel movement doesn't change what's on the display.
+        if not change_x and not change_y:
+            return
+        width, height = self.display.get_size()
+        # Shifting the display costs about as much as redrawing all of
+        # it, so only shift when the revealed strips are small.
+        if (abs(change_x)*height + abs(change_y)*width)*2 >= width*height:
+            self.redraw_display()
+            return
+
+        self.display.scroll(-change_x, -change_y)
+        self.redraw_rects(*self._calculate_redraw_areas((change_x, change_y)))
 
     def move_or_center_display(self):
         """Move the display onto the background or center it.
@@ -433,14 +511,25 @@ class ScrollBackground:
         (-100.0, -100.0)
 
         """
-        display_rect = pg.Rect(tuple(self.true_pos), self.display.get_size())
-        display_rect.clamp_ip(self.scrolling_area)
-        if int(self.true_pos.x) != display_rect.x:
-            self.true_pos.x = display_rect.x
-        if int(self.true_pos.y) != display_rect.y:
-            self.true_pos.y = display_rect.y
+        x = int(self._true_x)
+        y = int(self._true_y)
+        width, height = self.display.get_size()
+        area_width, area_height = self._scrolling_size()
+        # The scrolling area starts at (0, 0), so a display that is
+        # already inside it can be left alone.
+        if (x >= 0 and y >= 0 and x + width <= area_width
+                and y + height <= area_height):
+            return
+        display_rect = self._display_rect
+        display_rect.update(x, y, width, height)
+        area_rect = self._area_rect
+        area_rect.update(0, 0, area_width, area_height)
+        display_rect.clamp_ip(area_rect)
+        if x != display_rect.x:
+            self._true_x = float(display_rect.x)
+        if y != display_rect.y:
+            self._true_y = float(display_rect.y)
 
-    @Vector2.sequence2vector2
     def _calculate_redraw_areas(self, position_change):
         """Calculate which areas need to be redrawn.
 
@@ -448,72 +537,59 @@ class ScrollBackground:
 
         Parameters
         ----------
-        position_change : Vector2
-
-        Returns
-        -------
-        redraw_positions : tuple of Vector2
-        redraw_areas : tuple of pygame.Rect
-
-        """
-        area1 = None
-        area2 = None
-        if position_change.x > 0:
-            scroll_x = (self.display_pos.x +
-                        self.display.get_width() - position_change.x)
-            pos1 = scroll_x - self.display_pos.x, 0
-            area1 = pg.Rect(
-                scroll_x,
-                self.display_pos.y,
-                position_change.x,
-                self.display.get_height())
-        elif position_change.x < 0:
-            pos1 = 0, 0
-            area1 = pg.Rect(
-                self.display_pos.x,
-                self.display_pos.y,
-                -position_change.x,
-                self.display.get_height())
-        if position_change.y > 0:
-            scroll_y = (self.display_pos.y +
-                        self.display.get_height() - position_change.y)
-            pos2 = 0, scroll_y - self.display_pos.y
-            area2 = pg.Rect(
-                self.display_pos.x,
-                scroll_y,
-                self.display.get_width(),
-                position_change.y)
-        elif position_change.y < 0:
-            pos2 = 0, 0
-            area2 = pg.Rect(
-                self.display_pos.x,
-                self.display_pos.y,
-                self.display.get_width(),
-                -position_change.y)
-        if area1 and area2:
-            return (pos1, pos2), (area1, area2)
-        elif area1:
-            return (pos1,), (area1,)
-        elif area2:
-            return (pos2,), (area2,)
-        else:
-            return (), ()
+        position_change : tuple of int
+            The change in the rounded display position.
+
+        Returns
+        -------
+        redraw_positions : list of tuple of int
+        redraw_areas : list of tuple of int
+            The areas as (left, top, width, height) tuples.
+
+        """
+        display_x, display_y = self._display_xy()
+        width, height = self.display.get_size()
+        change_x, change_y = position_change
+        positions = []
+        areas = []
+        if change_x > 0:
+            positions.append((width - change_x, 0))
+            areas.append(
+                (display_x + width - change_x, display_y, change_x, height))
+        elif change_x < 0:
+            positions.append((0, 0))
+            areas.append((display_x, display_y, -change_x, height))
+        # Leave out the corner that the column already covers.
+        row_x = max(-change_x, 0)
+        row_width = width - abs(change_x)
+        if row_width > 0:
+            if change_y > 0:
+                positions.append((row_x, height - change_y))
+                areas.append((display_x + row_x, display_y + height - change_y,
+                              row_width, change_y))
+            elif change_y < 0:
+                positions.append((row_x, 0))
+                areas.append(
+                    (display_x + row_x, display_y, row_width, -change_y))
+        return positions, areas
 
     def redraw_rects(self, redraw_positions, redraw_areas):
         """Redraw the redraw areas from the background to the display.
 
         Parameters
         ----------
-        redraw_positions : iterable of Vector2
-        redraw_areas : iterable of pygame.Rect
+        redraw_positions : iterable of tuple of int
+        redraw_areas : iterable of rect-style objects
 
         Returns
         -------
         None
 
         """
-        for pos, rect in zip(redraw_positions, redraw_areas):
-            self.display.blit(self.background, tuple(pos), rect)
+        self.display.blits(
+            [(self.background, tuple(pos), rect)
+             for pos, rect in zip(redraw_positions, redraw_areas)],
+            doreturn=0)
 
     def redraw_display(self):
         """Draw the background to the display.
@@ -523,9 +599,12 @@ class ScrollBackground:
         None
 
         """
-        self.display.fill((0, 0, 0))
-        self.display.blit(self.background, (0, 0),
-                          (tuple(self.display_pos), self.display.get_size()))
+        area = pg.Rect(self._display_xy(), self.display.get_size())
+        # The fill is only visible where the display extends past the
+        # background, e.g. when the background is smaller than it.
+        if not self.background.get_rect().contains(area):
+            self.display.fill((0, 0, 0))
+        self.display.blit(self.background, (0, 0), area)
 
     def draw_sprites(self, sprites):
         """Clear previously drawn sprites and draw new ones.
@@ -543,19 +622,19 @@ class ScrollBackground:
         draw_rects : list of pygame.Rect
 
         """
-        draw_rects = []
-        for rect in self.clear_rects:
-            clear_pos = Vector2(rect.topleft) - self.display_pos
-            draw_rects.append(
-                self.display.blit(self.background, tuple(clear_pos), rect))
+        display_x, display_y = self._display_xy()
+        blit_sequence = [
+            (self.background, (rect.x - display_x, rect.y - display_y), rect)
+            for rect in self.clear_rects]
         self.clear_rects.clear()
 
         for sprite in sprites:
-            draw_pos = Vector2(sprite.rect.topleft) - self.display_pos
-            draw_rect = self.display.blit(sprite.image, tuple(draw_pos))
-            self.clear_rects.append(sprite.rect.copy())
-            draw_rects.append(draw_rect)
-        return draw_rects
+            rect = sprite.rect
+            blit_sequence.append(
+                (sprite.image, (rect.x - display_x, rect.y - display_y)))
+            self.clear_rects.append(rect.copy())
+        # Clearing and drawing happen in one call, in the same order.
+        return self.display.blits(blit_sequence)
 
 
 class MultiSurfaceBackground(ScrollBackground):
@@ -568,7 +647,8 @@ class MultiSurfaceBackground(ScrollBackground):
     ----------
     background_surfaces : nested list of pygame.Surface
         All of the surfaces should be the same size so that they can
-        be combined into a square shape.
+        be combined into a square shape. Like the background of
+        `ScrollBackground`, the surfaces are used without copying them.
     display : pygame.Surface
     display_pos : Vector2
     repeating : bool
@@ -579,9 +659,16 @@ class MultiSurfaceBackground(ScrollBackground):
     ----------
     _original_background_surfaces : nested list of pygame.Surface
     background_surfaces : nested list of pygame.Surface
+        Surfaces are scaled to the current zoom when they become
+        visible, so surfaces that haven't been shown since the zoom
+        changed keep their old size.
     repeating : bool
     self.prev_surf_rect : pygame.Rect
         Tracks which surfaces were previously visible.
+    _surf_size : tuple of int
+        Size of a single background surface at the current zoom.
+    _scrolling_area : pygame.Rect
+        Cached scrolling area.
 
     """
 
@@ -589,9 +676,11 @@ class MultiSurfaceBackground(ScrollBackground):
                  repeating=False):
         super().__init__(pg.Surface((1, 1)), display, display_pos)
         self._original_background_surfaces = [
-            surf.copy() for surf in background_surfaces]
+            [self._convert_surface(surf) for surf in row]
+            for row in background_surfaces]
         self.background_surfaces = [
-            surf.copy() for surf in background_surfaces]
+            row.copy() for row in self._original_background_surfaces]
+        self._update_surface_size(background_surfaces[0][0].get_size())
         self.combine_surfaces()
         self.repeating = repeating
         self.prev_surf_rect = self.check_visible_surfaces()
@@ -607,11 +696,37 @@ class MultiSurfaceBackground(ScrollBackground):
         scrolling_area : pygame.Rect
 
         """
-        background_width = len(self.background_surfaces[0]) * (
-            self.background_surfaces[0][0].get_width())
-        background_height = len(self.background_surfaces) * (
-            self.background_surfaces[0][0].get_height())
-        return pg.Rect((0, 0), (background_width, background_height))
+        return self._scrolling_area.copy()
+
+    def _scrolling_size(self):
+        """Return the size of the scrolling area without building a rect.
+
+        Returns
+        -------
+        tuple of int
+
+        """
+        return self._scrolling_area.size
+
+    def _update_surface_size(self, surf_size):
+        """Cache the surface size and the scrolling area.
+
+        This needs to be called whenever the zoom changes.
+
+        Parameters
+        ----------
+        surf_size : tuple of int
+            Size of a single surface at the current zoom.
+
+        Returns
+        -------
+        None
+
+        """
+        self._surf_size = surf_width, surf_height = surf_size
+        self._scrolling_area = pg.Rect(
+            0, 0, len(self.background_surfaces[0]) * surf_width,
+            len(self.background_surfaces) * surf_height)
 
     def check_visible_surfaces(self):
         """Return a rect that represents each visible surface.
@@ -621,14 +736,14 @@ class MultiSurfaceBackground(ScrollBackground):
         pygame.Rect
 
         """
-        surf_width, surf_height = self.background_surfaces[0][0].get_size()
+        surf_width, surf_height = self._surf_size
 
-        left = math.floor(self.display_pos.x/surf_width)
-        top = math.floor(self.display_pos.y/surf_height)
-        right = math.floor(
-            (self.display_pos.x + self.display.get_width())/surf_width)
+        display_x, display_y = self._display_xy()
+        left = math.floor(display_x/surf_width)
+        top = math.floor(display_y/surf_height)
+        right = math.floor((display_x + self.display.get_width())/surf_width)
         bottom = math.floor(
-            (self.display_pos.y + self.display.get_height())/surf_height)
+            (display_y + self.display.get_height())/surf_height)
         return pg.Rect(left, top, right - left, bottom - top)
 
     def combine_surfaces(self, surface_rect=None):
@@ -645,22 +760,55 @@ class MultiSurfaceBackground(ScrollBackground):
 
         """
         surface_rect = surface_rect or self.check_visible_surfaces()
-        surf_width, surf_height = self.background_surfaces[0][0].get_size()
+        surf_width, surf_height = self._surf_size
         x_surfs = len(self.background_surfaces[0])
         y_surfs = len(self.background_surfaces)
 
-        self.background = pg.Surface((
-            (surface_rect.width + 1) * surf_width,
-            (surface_rect.height + 1) * surf_height))
-
+        # Size the surface for the most surfaces the display can show, so
+        # that it can be reused when the visible surfaces change.
+        display_width, display_height = self.display.get_size()
+        size = (
+            max(surface_rect.width + 1, display_width//surf_width + 2)
+            * surf_width,
+            max(surface_rect.height + 1, display_height//surf_height + 2)
+            * surf_height)
+        if self.background.get_size() != size:
+            self.background = pg.Surface(size)
+
+        # The modulo wraps negative indices around to the last surfaces.
+        blit_sequence = []
         for j in range(surface_rect.top, surface_rect.bottom + 1):
+            y = (j - surface_rect.top) * surf_height
             for i in range(surface_rect.left, surface_rect.right + 1):
-                pos = Vector2((i - surface_rect.left, j - surface_rect.top))
-                surf_x = abs(i % (x_surfs * (int(i / (abs(i) or 1)) or 1)))
-                surf_y = abs(j % (y_surfs * (int(j / (abs(j) or 1)) or 1)))
-                self.background.blit(
-                    self.background_surfaces[surf_y][surf_x],
-                    (pos.x * surf_width, pos.y * surf_height))
+                x = (i - surface_rect.left) * surf_width
+                blit_sequence.append(
+                    (self._scaled_surface(j % y_surfs, i % x_surfs), (x, y)))
+        self.background.blits(blit_sequence, doreturn=0)
+
+    def _scaled_surface(self, row, column):
+        """Return a background surface scaled to the current zoom.
+
+        The surface is only scaled if its size doesn't match the zoom.
+
+        Parameters
+        ----------
+        row, column : int
+            Indices of the surface in `background_surfaces`.
+
+        Returns
+        -------
+        pygame.Surface
+
+        """
+        surface = self.background_surfaces[row][column]
+        if surface.get_size() != self._surf_size:
+            original = self._original_background_surfaces[row][column]
+            if original.get_size() == self._surf_size:
+                surface = original
+            else:
+                surface = pg.transform.scale(original, self._surf_size)
+            self.background_surfaces[row][column] = surface
+        return surface
 
     @Vector2.sequence2vector2
     def offset_position(self, pos):
@@ -675,9 +823,10 @@ class MultiSurfaceBackground(ScrollBackground):
         offset_pos : Vector2
 
         """
-        surf_width, surf_height = self.background_surfaces[0][0].get_size()
-        left = math.floor(self.display_pos.x / surf_width) * surf_width
-        top = math.floor(self.display_pos.y / surf_height) * surf_height
+        surf_width, surf_height = self._surf_size
+        display_x, display_y = self._display_xy()
+        left = math.floor(display_x / surf_width) * surf_width
+        top = math.floor(display_y / surf_height) * surf_height
         return Vector2((pos.x - left, pos.y - top))
 
     @ScrollBackground.zoom.setter
@@ -693,64 +842,88 @@ class MultiSurfaceBackground(ScrollBackground):
         None
 
         """
+        if scale == self._zoom:
+            return
         original_size = self._original_background_surfaces[0][0].get_size()
-        new_width, new_height = (int(size*scale) for size in original_size)
-        for j in range(len(self.background_surfaces)):
-            for i in range(len(self.background_surfaces[0])):
-                self.background_surfaces[j][i] = pg.transform.scale(
-                    self._original_background_surfaces[j][i],
-                    (new_width, new_height))
-        self.true_pos.scale(scale / self.zoom)
+        # Surfaces are scaled in combine_surfaces once they're visible.
+        self._update_surface_size(
+            tuple(int(size*scale) for size in original_size))
+        self._true_x *= scale / self.zoom
+        self._true_y *= scale / self.zoom
         new_center = (
-            self.display_pos.copy() +
+            self.display_pos +
             Vector2(self.display.get_size()).scale(scale / (self.zoom*2)))
         self.center(new_center)
         self.combine_surfaces()
         self.redraw_display()
         self._zoom = scale
 
-    @Vector2.sequence2vector2
-    def scroll(self, position_change):
+    def scroll(self, position_change, change_y=None):
         """Scroll the display by position_change.
 
         Parameters
         ----------
-        position_change : Vector2
+        position_change : Vector2 or float
+            The change in position, or only the change in x if
+            `change_y` is given.
+        change_y : float, optional
+            The change in y.
 
         Returns
         -------
         None
 
         """
-        prev_pos = self.display_pos
-        self.true_pos += position_change
+        if change_y is None:
+            change_x, change_y = position_change
+        else:
+            change_x = position_change
+        prev_x = round(self._true_x)
+        prev_y = round(self._true_y)
+        self._true_x += change_x
+        self._true_y += change_y
         if not self.repeating:
             self.move_or_center_display()
-        position_change = self.display_pos - prev_pos
+        change_x = round(self._true_x) - prev_x
+        change_y = round(self._true_y) - prev_y
+        # Sub-pixel movement doesn't change what's on the display.
+        if not change_x and not change_y:
+            return
         curr_surf_rect = self.check_visible_surfaces()
         if self.prev_surf_rect != curr_surf_rect:
             self.combine_surfaces(surface_rect=curr_surf_rect)
             self.prev_surf_rect = curr_surf_rect
+        width, height = self.display.get_size()
+        # Shifting the display costs about as much as redrawing all of
+        # it, so only shift when the revealed strips are small.
+        if (abs(change_x)*height + abs(change_y)*width)*2 >= width*height:
+            self.redraw_display()
+            return
 
-        self.display.scroll(int(-position_change.x), int(-position_change.y))
-        self.redraw_rects(*self._calculate_redraw_areas(position_change))
+        self.display.scroll(-change_x, -change_y)
+        self.redraw_rects(*self._calculate_redraw_areas((change_x, change_y)))
 
     def redraw_rects(self, redraw_positions, redraw_areas):
         """Redraw the redraw areas from the background to the display.
 
         Parameters
         ----------
-        redraw_positions : iterable of Vector2
-        redraw_areas : iterable of pygame.Rect
+        redraw_positions : iterable of tuple of int
+        redraw_areas : iterable of rect-style objects
 
         Returns
         -------
         None
 
         """
-        for pos, rect in zip(redraw_positions, redraw_areas):
-            rect.topleft = tuple(self.offset_position(rect.topleft))
-            self.display.blit(self.background, tuple(pos), rect)
+        # The combined background starts at the first visible surface.
+        offset_x, offset_y = self.offset_position((0, 0)).asint()
+        self.display.blits(
+            [(self.background, tuple(pos),
+              (left + offset_x, top + offset_y, width, height))
+             for pos, (left, top, width, height) in zip(redraw_positions,
+                                                       redraw_areas)],
+            doreturn=0)
 
     def redraw_display(self):
         """Draw the background to the display.
@@ -760,11 +933,11 @@ class MultiSurfaceBackground(ScrollBackground):
         None
 
         """
-        surf_width, surf_height = self.background_surfaces[0][0].get_size()
-        pos = self.offset_position(self.display_pos)
-        self.display.fill((0, 0, 0))
-        self.display.blit(self.background, (0, 0),
-                          (tuple(pos), self.display.get_size()))
+        pos = self.offset_position(self._display_xy())
+        area = pg.Rect(pos.as_tuple(), self.display.get_size())
+        if not self.background.get_rect().contains(area):
+            self.display.fill((0, 0, 0))
+        self.display.blit(self.background, (0, 0), area)
 
     def draw_sprites(self, sprites):
         """Clear previously drawn sprites and draw new ones.
@@ -782,20 +955,22 @@ class MultiSurfaceBackground(ScrollBackground):
         draw_rects : list of pygame.Rect
 
         """
-        draw_rects = []
-        for rect in self.clear_rects:
-            clear_pos = Vector2(rect.topleft) - self.display_pos
-            rect.topleft = tuple(self.offset_position(rect.topleft))
-            draw_rects.append(
-                self.display.blit(self.background, tuple(clear_pos), rect))
+        display_x, display_y = self._display_xy()
+        # The combined background starts at the first visible surface.
+        offset_x, offset_y = self.offset_position((0, 0))
+        blit_sequence = [
+            (self.background, (rect.x - display_x, rect.y - display_y),
+             (rect.x + offset_x, rect.y + offset_y, rect.width, rect.height))
+            for rect in self.clear_rects]
         self.clear_rects.clear()
 
         for sprite in sprites:
-            draw_pos = Vector2(sprite.rect.topleft) - self.display_pos
-            draw_rect = self.display.blit(sprite.image, tuple(draw_pos))
-            self.clear_rects.append(sprite.rect.copy())
-            draw_rects.append(draw_rect)
-        return draw_rects
+            rect = sprite.rect
+            blit_sequence.append(
+                (sprite.image, (rect.x - display_x, rect.y - display_y)))
+            self.clear_rects.append(rect.copy())
+        # Clearing and drawing happen in one call, in the same order.
+        return self.display.blits(blit_sequence)
 
 
 if __name__ == "__main__":
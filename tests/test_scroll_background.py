@@ -5,12 +5,20 @@ its directory in the path variable. You also need pytest. To run the
 tests type pytest in the command prompt.
 """
 
+import os
+
+# The tests only draw to surfaces in memory, so no window or sound
+# device is needed. This has to happen before pygame is initialized.
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
 import pytest
 import pygame as pg
 
-from scroll_background import Vector2, ScrollBackground
+from scroll_background import (
+    Vector2, ScrollBackground, MultiSurfaceBackground)
 
-pg.init()
+pg.display.init()
 
 
 @pytest.fixture
@@ -26,119 +34,116 @@ def test_limit_scrolling(background):
     """Test that display_area stays inside scrolling_area.
     """
     background.scroll((500, 0))
-    assert tuple(background.display_pos) == (600, 300)
+    assert background.display_pos == (600, 300)
     background.scroll((-800, -800))
-    assert tuple(background.display_pos) == (0, 0)
+    assert background.display_pos == (0, 0)
 
 
 def test_scroll(background):
     """Test that display_area is moved correctly.
     """
     background.scroll((50, 50))
-    assert tuple(background.display_pos) == (350, 350)
+    assert background.display_pos == (350, 350)
     background.scroll((-50, -50))
-    assert tuple(background.display_pos) == (300, 300)
+    assert background.display_pos == (300, 300)
+
+
+def draw_grid(surface):
+    """Draw a green and blue checkerboard of 50x50 squares.
+    """
+    width, height = surface.get_size()
+    square = pg.Surface((50, 50)).convert(surface)
+    square.fill((0, 0, 255))
+    surface.fill((0, 255, 0))
+    surface.blits([(square, (x, y))
+                   for x in range(0, width, 50)
+                   for y in range(50 - x % 100, height, 100)], doreturn=0)
+
+
+@pytest.fixture(scope='session')
+def grid():
+    """Fixture that returns an 800x800 surface with a grid drawn on it.
+
+    The grid is only drawn once. Copy it instead of drawing on it.
+    """
+    surface = pg.Surface((800, 800))
+    draw_grid(surface)
+    return surface
 
 
 def compare_surfaces(surface1, surface2):
     """Return True if surfaces are identical, otherwise return false.
+
+    Only the color channels are compared.
     """
-    surface1_copy = surface1.copy()
-    surface1_copy.blit(surface2, (0, 0), special_flags=pg.BLEND_SUB)
-    surface2.blit(surface1, (0, 0), special_flags=pg.BLEND_SUB)
-    mask1 = pg.mask.from_threshold(surface1_copy, (0, 0, 0, 0), (1, 1, 1, 255))
-    mask2 = pg.mask.from_threshold(surface2, (0, 0, 0, 0), (1, 1, 1, 255))
-    mask1.invert()
-    mask2.invert()
-    return mask1.count() == mask2.count() == 0
+    if surface1.get_size() != surface2.get_size():
+        return False
+    return (pg.image.tobytes(surface1, 'RGB')
+            == pg.image.tobytes(surface2, 'RGB'))
 
 
-def test_scroll_output(background):
+def test_scroll_output(background, grid):
     """Test that the scroll surface looks correct after scrolling.
     """
-    # Draw a grid.
-    for x in range(0, 800, 50):
-        for y in range(0, 800, 50):
-            pg.draw.rect(
-                background.background, (0, 255, 0), (x, y, 50, 50))
-    for x in range(0, 800, 100):
-        for y in range(50, 800, 100):
-            pg.draw.rect(
-                background.background, (0, 0, 255), (x, y, 50, 50))
-    for x in range(50, 800, 100):
-        for y in range(0, 800, 100):
-            pg.draw.rect(
-                background.background, (0, 0, 255), (x, y, 50, 50))
+    display_size = background.display.get_size()
+    background.background.blit(grid, (0, 0))
     background.display.blit(
             background.background,
             (0, 0),
-            pg.Rect(tuple(background.display_pos),
-                    background.display.get_size()))
+            pg.Rect(tuple(background.display_pos), display_size))
 
     background.scroll((50, 50))
-    display_area = pg.Rect(tuple(background.display_pos),
-                           background.display.get_size())
+    display_area = pg.Rect(tuple(background.display_pos), display_size)
     correct_surf = background.background.subsurface(display_area)
     assert compare_surfaces(correct_surf, background.display)
 
 
-def test_scroll_output2(background):
-    """Test scroll output with a small background surface.
+def test_scroll_clips_down(background):
+    """Scrolling past the bottom of a small background should stop there.
     """
     background.display = pg.Surface((1000, 200))
     background.display_pos = (-100, 0)
-    # Draw a grid.
-    for x in range(0, 800, 50):
-        for y in range(0, 800, 50):
-            pg.draw.rect(
-                background.background, (0, 255, 0), (x, y, 50, 50))
-    for x in range(0, 800, 100):
-        for y in range(50, 800, 100):
-            pg.draw.rect(
-                background.background, (0, 0, 255), (x, y, 50, 50))
-    for x in range(50, 800, 100):
-        for y in range(0, 800, 100):
-            pg.draw.rect(
-                background.background, (0, 0, 255), (x, y, 50, 50))
-    background.display.blit(
-            background.background,
-            (0, 0),
-            pg.Rect(tuple(background.display_pos),
-                    background.display.get_size()))
+    background.scroll((0, 600))
+    assert background.display_pos == (-100, 600)
+    background.scroll((0, 600))
+    assert background.display_pos == (-100, 600)
+
 
+def test_scroll_roundtrip(background, grid):
+    """Scrolling down and back up should restore a small background.
+    """
+    background.display = pg.Surface((1000, 200))
+    background.display_pos = (-100, 0)
+    background.background.blit(grid, (0, 0))
     display_area = pg.Rect(tuple(background.display_pos),
                            background.display.get_size())
-    correct_surf = pg.Surface((1000, 200))
-    correct_surf.blit(background.background, (0, 0), display_area)
+    background.display.blit(background.background, (0, 0), display_area)
+
+    # Only the part of the display over the background shows it.
+    visible_area = display_area.clip(background.background.get_rect())
+    correct_surf = background.background.subsurface(visible_area)
     background.scroll((0, 600))
     background.scroll((0, -600))
-    assert compare_surfaces(correct_surf, background.display)
+    assert compare_surfaces(
+        correct_surf, background.display.subsurface(
+            visible_area.move(-display_area.x, -display_area.y)))
+    for outside_area in ((0, 0, 100, 200), (900, 0, 100, 200)):
+        color = pg.transform.average_color(background.display, outside_area)
+        assert color[:3] == (0, 0, 0)
 
 
-def test_redraw_areas(background):
-    """Redraw areas should be inside scrolling_area.
+@pytest.mark.parametrize('position_change, positions', [
+    ((50, 50), [(150, 0), (0, 150)]),
+    ((-50, -50), [(0, 0), (50, 0)]),
+])
+def test_redraw_areas(background, position_change, positions):
+    """Redraw areas should be inside scrolling_area and the correct size.
     """
-    redraw_positions, _ = background._calculate_redraw_areas(
-        Vector2((50, 50)))
-    assert redraw_positions[0] == (150, 0)
-    assert redraw_positions[1] == (0, 150)
-    redraw_positions, _ = background._calculate_redraw_areas(
-        Vector2((-50, -50)))
-    assert redraw_positions[0] == (0, 0)
-    assert redraw_positions[1] == (0, 0)
-
-
-def test_redraw_area_size(background):
-    """Test that redraw areas are the correct size.
-    """
-    _, redraw_areas = background._calculate_redraw_areas(
-        Vector2((50, 50)))
-    assert redraw_areas[0].size == (50, 200)
-    assert redraw_areas[1].size == (200, 50)
-    _, redraw_areas = background._calculate_redraw_areas(
-        Vector2((-50, -50)))
-    assert redraw_areas[0].size == (50, 200)
-    assert redraw_areas[1].size == (200, 50)
+    redraw_positions, redraw_areas = background._calculate_redraw_areas(
+        Vector2(position_change))
+    assert redraw_positions == positions
+    assert redraw_areas[0][2:] == (50, 200)
+    assert redraw_areas[1][2:] == (150, 50)
 
 
 def test_no_drift(background):
@@ -167,3 +172,141 @@ def test_draw_sprites(background):
     correct_surf = background.background.subsurface(
         (tuple(background.display_pos), background.display.get_size()))
     assert compare_surfaces(correct_surf, background.display)
+
+
+def test_display_pos_not_shared():
+    """Scrolling shouldn't modify the vector passed to the constructor.
+    """
+    display_pos = Vector2((300, 300))
+    background = ScrollBackground(
+        pg.Surface((800, 800)), pg.Surface((200, 200)), display_pos)
+    background.scroll((50, 50))
+    assert tuple(display_pos) == (300, 300)
+
+
+def test_true_pos_assignment(background):
+    """true_pos returns a copy, so only assigning to it moves the display.
+    """
+    background.true_pos.x += 5
+    assert background.true_pos == (300, 300)
+    background.true_pos += (5.5, 0)
+    assert background.true_pos == (305.5, 300)
+    assert background.display_pos == (306, 300)
+
+
+def test_background_not_copied():
+    """The background surface should be used as it is, without a copy.
+    """
+    surface = pg.Surface((800, 800))
+    background = ScrollBackground(surface, pg.Surface((200, 200)), (0, 0))
+    assert background.background is surface
+
+
+def test_scroll_output_diagonal(background):
+    """Test scroll output when scrolling diagonally in both directions.
+    """
+    for x in range(0, 800, 50):
+        for y in range(0, 800, 50):
+            pg.draw.rect(background.background,
+                         ((x * 3) % 256, (y * 5) % 256, 100), (x, y, 50, 50))
+    background.redraw_display()
+    for position_change in ((30, 40), (-70, 20), (10, -60), (-40, -40)):
+        background.scroll(position_change)
+        correct_surf = background.background.subsurface(
+            (tuple(background.display_pos), background.display.get_size()))
+        assert compare_surfaces(correct_surf, background.display)
+
+
+def test_redraw_display_outside_background(background):
+    """Parts of the display outside the background should be cleared.
+    """
+    background.display = pg.Surface((1000, 200))
+    background.display.fill((255, 255, 255))
+    background.background.fill((0, 255, 0))
+    background.display_pos = (-100, 0)
+    background.redraw_display()
+    assert background.display.get_at((0, 0)) == (0, 0, 0, 255)
+    assert background.display.get_at((100, 0)) == (0, 255, 0, 255)
+
+
+def test_repeating_wraps_around():
+    """Surfaces left of the first one should repeat from the last one.
+    """
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    surfaces = []
+    for color in colors:
+        surface = pg.Surface((100, 100))
+        surface.fill(color)
+        surfaces.append(surface)
+    background = MultiSurfaceBackground(
+        [surfaces], pg.Surface((100, 100)), (0, 0), repeating=True)
+    background.redraw_display()
+    background.scroll((-50, 0))
+    assert background.display.get_at((0, 50))[:3] == colors[2]
+    assert background.display.get_at((99, 50))[:3] == colors[0]
+
+
+def test_scrolling_area_is_a_copy():
+    """Changing the returned scrolling_area shouldn't affect clamping.
+    """
+    surfaces = [[pg.Surface((100, 100)) for i in range(3)] for j in range(3)]
+    background = MultiSurfaceBackground(
+        surfaces, pg.Surface((100, 100)), (0, 0))
+    background.scrolling_area.width = 50
+    background.scroll((200, 200))
+    assert background.display_pos == (200, 200)
+    assert background.scrolling_area.size == (300, 300)
+
+
+def test_multi_surface_small_scroll(grid):
+    """Small scrolls across surface edges should match the background.
+    """
+    surfaces = [[grid.subsurface((x, y, 200, 200))
+                 for x in range(0, 800, 200)] for y in range(0, 800, 200)]
+    background = MultiSurfaceBackground(
+        surfaces, pg.Surface((150, 150)), (130, 120))
+    background.redraw_display()
+    for position_change in ((30, 20), (-40, 15), (10, -50), (35, 35)):
+        background.scroll(position_change)
+        correct_surf = grid.subsurface(
+            (tuple(background.display_pos), background.display.get_size()))
+        assert compare_surfaces(correct_surf, background.display)
+
+
+def test_multi_surface_draw_sprites(grid):
+    """Moved sprites should be cleared from a multi-surface background.
+    """
+    surfaces = [[grid.subsurface((x, y, 200, 200))
+                 for x in range(0, 800, 200)] for y in range(0, 800, 200)]
+    background = MultiSurfaceBackground(
+        surfaces, pg.Surface((150, 150)), (330, 320))
+    background.redraw_display()
+    sprite = pg.sprite.Sprite()
+    sprite.image = pg.Surface((40, 40))
+    sprite.image.fill((232, 32, 3))
+    sprite.rect = pg.Rect(360, 380, 40, 40)
+    background.draw_sprites((sprite,))
+    sprite.rect.move_ip(30, -20)
+    background.draw_sprites((sprite,))
+
+    correct_surf = grid.subsurface(
+        (tuple(background.display_pos), background.display.get_size())).copy()
+    correct_surf.blit(sprite.image, sprite.rect.move(-330, -320))
+    assert compare_surfaces(correct_surf, background.display)
+
+
+def test_zoom_reuses_scaled_background(background):
+    """Returning to a zoom level should reuse its scaled background.
+    """
+    original = background.background
+    background.zoom = 2
+    scaled = background.background
+    assert scaled.get_size() == (1600, 1600)
+    background.zoom = 1
+    assert background.background is original
+    background.zoom = 2
+    assert background.background is scaled
+    # Only the last scaled background is kept.
+    background.zoom = 3
+    background.zoom = 2
+    assert background.background is not scaled